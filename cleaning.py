@@ -1,9 +1,218 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pycountry import countries
-from fuzzywuzzy import process
+from rapidfuzz import fuzz, process, utils
+
+# Full or abbreviated month names, compiled once for every call to clean_date
+_MONTH_RE = re.compile(r'(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?'
+                       r'|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)', re.IGNORECASE)
+_YEAR_RE = re.compile(r'(\d{4})')
+
+# Full month name for the first three letters of each month
+_MONTH_NAMES = {'Jan': 'January', 'Feb': 'February', 'Mar': 'March', 'Apr': 'April', 'May': 'May',
+                'Jun': 'June', 'Jul': 'July', 'Aug': 'August', 'Sep': 'September',
+                'Oct': 'October', 'Nov': 'November', 'Dec': 'December'}
+
+# Standard value for the non-standard entries of the 'Type' column
+_TYPE_MAPPING = {'?': 'Unconfirmed', 
+                 'Unverified': 'Unconfirmed', 
+                 'Invalid': 'Unconfirmed',
+                 'Questionable': 'Unconfirmed',
+                 'unprovoked': 'Unprovoked',
+                 ' Provoked': 'Provoked',
+                 'Boat': 'Watercraft'}
+
+# Standard value for each stripped, uppercased entry of the 'Fatal Y/N' column, anything else is unknown
+_FATAL_MAPPING = {'Y': 'Yes',
+                  'YES': 'Yes',
+                  'Y X 2': 'Yes',
+                  'F': 'Yes',
+                  'N': 'No',
+                  'NO': 'No',
+                  'NQ': 'No'}
+
+# Standard value for each stripped, uppercased entry of the 'Sex' column, anything else is unknown
+_SEX_MAPPING = {'M': 'M',
+                'F': 'F',
+                'LLI': 'M',
+                'M X 2': 'M',
+                'N': 'M'}
+_SEX_KEYS = pa.array(list(_SEX_MAPPING))
+_SEX_VALUES = pa.array(list(_SEX_MAPPING.values()))
+
+# Injury keywords for each body part, checked in order by clean_injury
+_BODY_PART_PATTERNS = {
+    'Leg / Foot': re.compile(r'leg|thigh|calf|foot', re.IGNORECASE),
+    'Arm': re.compile(r'arm|bicep|wrist', re.IGNORECASE),
+    'Hand / Fingers': re.compile(r'hand|finger', re.IGNORECASE),
+    'Shoulder': re.compile(r'shoulder', re.IGNORECASE),
+    'Body / Abdomen': re.compile(r'abdomen|stomach|torso|body', re.IGNORECASE),
+    'Head / Neck': re.compile(r'head|face|neck', re.IGNORECASE)
+}
+
+# All country names from pycountry, read once at import
+_COUNTRY_NAMES = tuple(country.name for country in countries)
+_COUNTRY_NAMES_PREP = [utils.default_process(name) for name in _COUNTRY_NAMES]
+_COUNTRY_SET = frozenset(_COUNTRY_NAMES)
+
+# Direct replacements for common cases
+_COUNTRY_REPLACEMENTS = {
+    'USA': 'United States',
+    'AUSTRALIA': 'Australia',
+    'CEYLON (SRI LANKA)': 'Sri Lanka',
+    'SOUTH AFRICA': 'South Africa'
+}
+
+# State mappings for major countries
+_STATE_MAPPINGS = {
+    'United States': ['Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming'],
+    'Australia': ['New South Wales', 'Victoria', 'Queensland', 'Western Australia', 'South Australia', 'Tasmania', 'Northern Territory', 'Australian Capital Territory'],
+    'Canada': ['Alberta', 'British Columbia', 'Manitoba', 'New Brunswick', 'Newfoundland and Labrador', 'Northwest Territories', 'Nova Scotia', 'Nunavut', 'Ontario', 'Prince Edward Island', 'Quebec', 'Saskatchewan', 'Yukon'],
+    'Brazil': ['Acre', 'Alagoas', 'Amapá', 'Amazonas', 'Bahia', 'Ceará', 'Distrito Federal', 'Espírito Santo', 'Goiás', 'Maranhão', 'Mato Grosso', 'Mato Grosso do Sul', 'Minas Gerais', 'Pará', 'Paraíba', 'Paraná', 'Pernambuco', 'Piauí', 'Rio de Janeiro', 'Rio Grande do Norte', 'Rio Grande do Sul', 'Rondônia', 'Roraima', 'Santa Catarina', 'São Paulo', 'Sergipe', 'Tocantins']
+}
+
+# Per country: the valid states, the same states preprocessed for rapidfuzz, and a set for exact matches
+_STATE_CHOICES = {country: (states, [utils.default_process(state) for state in states], frozenset(states))
+                  for country, states in _STATE_MAPPINGS.items()}
+
+# Activity categories and keywords
+_ACTIVITY_KEYWORDS = {
+    'Swimming': ['swimming', 'bathing', 'wading', 'floating'],
+    'Surfing': ['surfing', 'surf', 'bodyboarding', 'boogie boarding'],
+    'Diving': ['diving', 'snorkeling', 'free diving', 'scuba'],
+    'Fishing': ['fishing', 'spearfishing', 'angling'],
+    'Boating': ['boating', 'sailing', 'kayaking', 'canoeing'],
+    'Other': ['walking', 'standing', 'fell overboard', 'unknown']
+}
+
+# Flatten all keywords for fuzzy matching
+_ALL_ACTIVITY_KEYWORDS = [keyword for keywords in _ACTIVITY_KEYWORDS.values() for keyword in keywords]
+_ALL_ACTIVITY_KEYWORDS_PREP = [utils.default_process(keyword) for keyword in _ALL_ACTIVITY_KEYWORDS]
+
+# Category of each keyword, for the keywords found by fuzzy matching
+_KEYWORD_CATEGORIES = {keyword: category for category, keywords in _ACTIVITY_KEYWORDS.items() for keyword in keywords}
+
+# Real shark species list
+_SHARK_SPECIES = [
+    'Great White Shark', 'Tiger Shark', 'Bull Shark', 'Blacktip Shark', 'Sandbar Shark',
+    'Nurse Shark', 'Lemon Shark', 'Hammerhead Shark', 'Mako Shark', 'Blue Shark',
+    'Sand Tiger Shark', 'Reef Shark', 'Wobbegong Shark', 'Thresher Shark', 'Dusky Shark',
+    'Spinner Shark', 'Silky Shark', 'Bronze Whaler Shark', 'Galapagos Shark', 'Grey Reef Shark',
+    'Blacktip Reef Shark', 'Whitetip Reef Shark', 'Caribbean Reef Shark', 'Silvertip Shark',
+    'Oceanic Whitetip Shark', 'Porbeagle Shark', 'Basking Shark', 'Whale Shark', 'Goblin Shark',
+    'Angel Shark', 'Leopard Shark', 'Dogfish Shark', 'Sevengill Shark', 'Sixgill Shark'
+]
+_SHARK_SPECIES_PREP = [utils.default_process(species) for species in _SHARK_SPECIES]
+_SHARK_SPECIES_SET = frozenset(_SHARK_SPECIES)
+
+# Species descriptions containing one of these terms are unknown
+_INVALID_SPECIES_TERMS = frozenset(['invalid', 'questionable', 'not confirmed', 'unconfirmed', 'not stated'])
+
+# Common name mappings
+_SPECIES_NAME_MAP = {
+    'white shark': 'Great White Shark',
+    'great white': 'Great White Shark',
+    'bull shark': 'Bull Shark',
+    'tiger shark': 'Tiger Shark',
+    'blacktip shark': 'Blacktip Shark',
+    'sand tiger': 'Sand Tiger Shark',
+    'wobbegong': 'Wobbegong Shark',
+    'hammerhead': 'Hammerhead Shark',
+    'mako': 'Mako Shark',
+    'blue shark': 'Blue Shark',
+    'nurse shark': 'Nurse Shark',
+    'lemon shark': 'Lemon Shark',
+    'spinner shark': 'Spinner Shark',
+    'dusky shark': 'Dusky Shark',
+    'silky shark': 'Silky Shark',
+    'bronze whaler': 'Bronze Whaler Shark',
+    'galapagos shark': 'Galapagos Shark',
+    'grey reef shark': 'Grey Reef Shark',
+    'blacktip reef shark': 'Blacktip Reef Shark',
+    'whitetip reef shark': 'Whitetip Reef Shark',
+    'caribbean reef shark': 'Caribbean Reef Shark',
+    'silvertip shark': 'Silvertip Shark',
+    'oceanic whitetip shark': 'Oceanic Whitetip Shark',
+    'porbeagle shark': 'Porbeagle Shark',
+    'basking shark': 'Basking Shark',
+    'whale shark': 'Whale Shark',
+    'goblin shark': 'Goblin Shark',
+    'angel shark': 'Angel Shark',
+    'leopard shark': 'Leopard Shark',
+    'dogfish shark': 'Dogfish Shark',
+    'sevengill shark': 'Sevengill Shark',
+    'sixgill shark': 'Sixgill Shark',
+    'reef shark': 'Reef Shark',
+    'sandbar shark': 'Sandbar Shark',
+    'thresher shark': 'Thresher Shark',
+    'reef': 'Reef Shark',
+    'sand tiger shark': 'Sand Tiger Shark',
+    'sand tiger': 'Sand Tiger Shark',
+    'unconfirmed': 'Unknown',
+    'Unconfirmed': 'Unknown',
+    'unknown': 'Unknown'
+}
+
+def _best_matches(queries, choices, prepared_choices, score_cutoff):
+    """
+    Fuzzy matches a batch of strings against a list of choices.
+
+    All queries are scored against all choices in a single call to
+    rapidfuzz's cdist, which spreads the work over every available core.
+    The choices come already preprocessed so only the queries are
+    normalized here, once each.
+
+    Args:
+        queries (list): The strings to match.
+        choices (list): The valid values to match against.
+        prepared_choices (list): The choices passed through rapidfuzz's default_process.
+        score_cutoff (int): The minimum score for a fuzzy match to be considered valid.
 
-def clean_type(raw_shark_attack_df):
+    Returns:
+        dict: Maps each query to its best matching choice, or None when no
+        choice reaches the score cutoff.
+    """
+    queries = list(queries)
+    if not queries:
+        return {}
+    prepared_queries = [utils.default_process(query) for query in queries]
+    scores = process.cdist(prepared_queries, prepared_choices, scorer=fuzz.WRatio, processor=None,
+                           score_cutoff=score_cutoff, workers=-1)
+    best = scores.argmax(axis=1)
+    matched = scores.max(axis=1) >= score_cutoff
+    matches = np.where(matched, np.asarray(choices, dtype=object)[best], None)
+    return dict(zip(queries, matches))
+
+def _recode_categories(values, recode, na_value=None):
+    """
+    Recodes a column through its distinct values only.
+
+    The column is encoded as a category and recode is applied to each
+    category instead of each row. Categories recoded to the same value are
+    merged and the rows are remapped through the category codes.
+
+    Args:
+        values (pd.Series): The column to recode.
+        recode (callable): Returns the new value for a category, or None to make it missing.
+        na_value (str): The value for missing rows, or None to leave them missing.
+
+    Returns:
+        pd.Series: The recoded column as a category.
+    """
+    values = values.astype('category')
+    
+    # The last entry is picked up by the -1 code of missing rows
+    recoded = pd.Index([recode(category) for category in values.cat.categories] + [na_value], dtype=object)
+    categories = pd.Index(recoded.dropna().unique())
+    codes = categories.get_indexer(recoded)[values.cat.codes]
+    return pd.Series(pd.Categorical.from_codes(codes, categories), index=values.index, name=values.name)
+
+def clean_type(shark_attack_df):
     """
     Cleans the 'Type' column of the shark attack DataFrame.
 
@@ -13,23 +222,17 @@ def clean_type(raw_shark_attack_df):
     and 'Watercraft'.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
 
     Returns:
-        pd.DataFrame: A new DataFrame with the 'Type' column cleaned.
+        pd.DataFrame: The DataFrame with the 'Type' column cleaned.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
-    shark_attack_df['Type'] = shark_attack_df['Type'].replace({'?': 'Unconfirmed', 
-                                                          'Unverified': 'Unconfirmed', 
-                                                          'Invalid': 'Unconfirmed',
-                                                          'Questionable': 'Unconfirmed',
-                                                          pd.NA: 'Unconfirmed',
-                                                          'unprovoked': 'Unprovoked',
-                                                          ' Provoked': 'Provoked',
-                                                          'Boat': 'Watercraft'})
+    shark_attack_df['Type'] = _recode_categories(shark_attack_df['Type'],
+                                                 lambda attack_type: _TYPE_MAPPING.get(attack_type, attack_type),
+                                                 na_value='Unconfirmed')
     return shark_attack_df
 
-def clean_sex(raw_shark_attack_df):
+def clean_sex(shark_attack_df):
     """
     Cleans the 'Sex' column of the shark attack DataFrame.
 
@@ -38,37 +241,44 @@ def clean_sex(raw_shark_attack_df):
     for unknown values.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
 
     Returns:
-        pd.DataFrame: A new DataFrame with the 'Sex' column cleaned.
+        pd.DataFrame: The DataFrame with the 'Sex' column cleaned.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
-    shark_attack_df['Sex'] = shark_attack_df['Sex'].str.strip()
-    shark_attack_df['Sex'] = shark_attack_df['Sex'].str.upper()
-    shark_attack_df['Sex'] = shark_attack_df['Sex'].replace('.', np.nan)
-    shark_attack_df['Sex'] = shark_attack_df['Sex'].replace({'LLI': 'M', 
-                                                          'M X 2': 'M', 
-                                                          'N': 'M',
-                                                          '.': np.nan})
+    # Strip, uppercase and look up every entry with Arrow kernels on the column's buffer
+    sex = pa.array(shark_attack_df['Sex'].astype('string[pyarrow]'))
+    sex = pc.utf8_upper(pc.utf8_trim_whitespace(sex))
+    sex = pc.take(_SEX_VALUES, pc.index_in(sex, value_set=_SEX_KEYS))
+    shark_attack_df['Sex'] = pd.Series(pd.array(sex, dtype='string[pyarrow]'),
+                                       index=shark_attack_df.index).astype('category')
     return shark_attack_df
 
-def clean_age(raw_shark_attack_df):
+def clean_age(shark_attack_df):
     """
     Cleans the 'Age' column of the shark attack DataFrame.
 
     This function converts the 'Age' column to a numeric type, coercing any
-    non-numeric values to NaN. It then casts the column to an integer type
-    that supports missing values.
+    non-numeric values to null. It then casts the column to an Arrow-backed
+    32-bit integer type that supports missing values. Ages outside the 32-bit
+    range also become null, and fractional ages raise as they did with 'Int64'.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
 
     Returns:
-        pd.DataFrame: A new DataFrame with the 'Age' column cleaned.
+        pd.DataFrame: The DataFrame with the 'Age' column cleaned.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
-    shark_attack_df['Age'] = pd.to_numeric(shark_attack_df['Age'], errors='coerce').astype('Int64')
+    # Work on the text form of every age, so a single Arrow cast converts the whole column
+    ages = pc.utf8_trim_whitespace(pa.array(shark_attack_df['Age'].astype('string[pyarrow]')))
+    # Non-numeric ages become null instead of failing the cast, the pattern accepts what pd.to_numeric does
+    is_number = pc.match_substring_regex(ages, r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$')
+    ages = pc.cast(pc.if_else(is_number, ages, None), pa.float64())
+    
+    # Ages that do not fit in the 32-bit column become null as well
+    in_range = pc.and_(pc.greater_equal(ages, np.iinfo(np.int32).min), pc.less_equal(ages, np.iinfo(np.int32).max))
+    ages = pc.cast(pc.if_else(in_range, ages, None), pa.int32())
+    shark_attack_df['Age'] = pd.Series(pd.array(ages, dtype='int32[pyarrow]'), index=shark_attack_df.index)
     return shark_attack_df
 
 def drop_useless_columns(raw_shark_attack_df):
@@ -94,7 +304,7 @@ def drop_useless_columns(raw_shark_attack_df):
                                                     ,'Unnamed: 21','Unnamed: 22', 'Location', 'Time'
                                                     ], errors='ignore')
 
-def clean_date(raw_shark_attack_df):
+def clean_date(shark_attack_df):
     """
     Cleans the date-related columns of the shark attack DataFrame.
 
@@ -102,39 +312,38 @@ def clean_date(raw_shark_attack_df):
     creates new 'Month' and 'Year' columns, and drops the original 'Date' and 'Year' columns.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
 
     Returns:
-        pd.DataFrame: A new DataFrame with cleaned date columns.
+        pd.DataFrame: The DataFrame with cleaned date columns.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
     
-    # Extract month from Date column
-    shark_attack_df['Month'] = shark_attack_df['Date'].str.extract(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)', expand=False)
+    # Only text dates are searched, the column also holds datetimes and NaN
+    dates = [date if isinstance(date, str) else '' for date in shark_attack_df['Date'].to_numpy(dtype=object)]
     
-    # Map abbreviated months to full names
-    month_map = {'Jan': 'January', 'Feb': 'February', 'Mar': 'March', 'Apr': 'April', 
-                 'Jun': 'June', 'Jul': 'July', 'Aug': 'August', 'Sep': 'September', 
-                 'Oct': 'October', 'Nov': 'November', 'Dec': 'December'}
-    shark_attack_df['Month'] = shark_attack_df['Month'].replace(month_map)
+    # Extract month from Date column and map it to its full name
+    months = [_MONTH_NAMES[match.group(1)[:3].title()] if (match := _MONTH_RE.search(date)) else None
+              for date in dates]
+    shark_attack_df['Month'] = pd.Series(months, index=shark_attack_df.index, dtype='string')
     
     # Clean Year column - convert to integer, handle 0 values
     shark_attack_df['Fixed Year'] = pd.to_numeric(shark_attack_df['Year'], errors='coerce')
     shark_attack_df.loc[shark_attack_df['Fixed Year'] == 0, 'Fixed Year'] = np.nan
     
     # Extract year from Date column when Fixed Year is missing
-    date_year = shark_attack_df['Date'].str.extract(r'(\d{4})', expand=False)
+    date_year = pd.Series([match.group(1) if (match := _YEAR_RE.search(date)) else None for date in dates],
+                          index=shark_attack_df.index, dtype='string')
     shark_attack_df['Fixed Year'] = shark_attack_df['Fixed Year'].fillna(pd.to_numeric(date_year, errors='coerce')).astype('Int64')
 
     # drop column 'Year' and 'Date'
-    shark_attack_df = shark_attack_df.drop(columns=['Year', 'Date'], errors='ignore')
+    shark_attack_df.drop(columns=['Year', 'Date'], errors='ignore', inplace=True)
 
     # rename 'Fixed Year' to 'Year'
-    shark_attack_df = shark_attack_df.rename(columns={'Fixed Year': 'Year'})
+    shark_attack_df.rename(columns={'Fixed Year': 'Year'}, inplace=True)
     
     return shark_attack_df
 
-def clean_state(raw_shark_attack_df, score_cutoff):
+def clean_state(shark_attack_df, score_cutoff):
     """
     Cleans the 'State' column of the shark attack DataFrame.
 
@@ -143,46 +352,30 @@ def clean_state(raw_shark_attack_df, score_cutoff):
     countries to ensure consistency.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
         score_cutoff (int): The minimum score for a fuzzy match to be considered valid.
 
     Returns:
-        pd.DataFrame: A new DataFrame with the 'State' column cleaned.
+        pd.DataFrame: The DataFrame with the 'State' column cleaned.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
-    
-    # State mappings for major countries
-    state_mappings = {
-        'United States': ['Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado', 'Connecticut', 'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho', 'Illinois', 'Indiana', 'Iowa', 'Kansas', 'Kentucky', 'Louisiana', 'Maine', 'Maryland', 'Massachusetts', 'Michigan', 'Minnesota', 'Mississippi', 'Missouri', 'Montana', 'Nebraska', 'Nevada', 'New Hampshire', 'New Jersey', 'New Mexico', 'New York', 'North Carolina', 'North Dakota', 'Ohio', 'Oklahoma', 'Oregon', 'Pennsylvania', 'Rhode Island', 'South Carolina', 'South Dakota', 'Tennessee', 'Texas', 'Utah', 'Vermont', 'Virginia', 'Washington', 'West Virginia', 'Wisconsin', 'Wyoming'],
-        'Australia': ['New South Wales', 'Victoria', 'Queensland', 'Western Australia', 'South Australia', 'Tasmania', 'Northern Territory', 'Australian Capital Territory'],
-        'Canada': ['Alberta', 'British Columbia', 'Manitoba', 'New Brunswick', 'Newfoundland and Labrador', 'Northwest Territories', 'Nova Scotia', 'Nunavut', 'Ontario', 'Prince Edward Island', 'Quebec', 'Saskatchewan', 'Yukon'],
-        'Brazil': ['Acre', 'Alagoas', 'Amapá', 'Amazonas', 'Bahia', 'Ceará', 'Distrito Federal', 'Espírito Santo', 'Goiás', 'Maranhão', 'Mato Grosso', 'Mato Grosso do Sul', 'Minas Gerais', 'Pará', 'Paraíba', 'Paraná', 'Pernambuco', 'Piauí', 'Rio de Janeiro', 'Rio Grande do Norte', 'Rio Grande do Sul', 'Rondônia', 'Roraima', 'Santa Catarina', 'São Paulo', 'Sergipe', 'Tocantins']
-    }
-    
-    def match_state(row):
-        state = row['State']
-        country = row['Country']
-        
-        if pd.isna(state) or pd.isna(country):
-            return state
-            
-        state = str(state).strip()
-        if not state:
-            return state
-            
-        # Get states for the country
-        country_states = state_mappings.get(country, [])
-        if not country_states:
-            return state
-            
-        # Use fuzzy matching
-        match = process.extractOne(state, country_states, score_cutoff=score_cutoff)
-        return match[0] if match else state
-    
-    shark_attack_df['State'] = shark_attack_df.apply(match_state, axis=1)
+    
+    # Rows missing either the country or the state are left as is, the others are at least stripped
+    has_both = shark_attack_df['Country'].notna() & shark_attack_df['State'].notna()
+    states = shark_attack_df.loc[has_both, 'State'].astype(str).str.strip()
+    state_countries = shark_attack_df.loc[has_both, 'Country']
+    
+    # Fuzzy match the distinct misspelled states of each known country in a single batch
+    for country, (choices, prepared_choices, valid_states) in _STATE_CHOICES.items():
+        in_country = state_countries == country
+        country_states = states[in_country]
+        queries = [state for state in country_states.unique() if state and state not in valid_states]
+        matches = _best_matches(queries, choices, prepared_choices, score_cutoff)
+        states[in_country] = country_states.map(matches).fillna(country_states)
+    
+    shark_attack_df.loc[has_both, 'State'] = states
     return shark_attack_df
 
-def clean_country(raw_shark_attack_df, score_cutoff=80):
+def clean_country(shark_attack_df, score_cutoff=80):
     """
     Cleans the 'Country' column of the shark attack DataFrame.
 
@@ -191,16 +384,18 @@ def clean_country(raw_shark_attack_df, score_cutoff=80):
     pycountry library to ensure consistency.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
         score_cutoff (int): The minimum score for a fuzzy match to be considered valid.
 
     Returns:
-        pd.DataFrame: A new DataFrame with the 'Country' column cleaned.
+        pd.DataFrame: The DataFrame with the 'Country' column cleaned.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
     
-    # Get list of all country names
-    country_names = [country.name for country in countries]
+    # Fuzzy match all distinct names in a single batch
+    names = shark_attack_df['Country'].dropna().astype(str).str.strip().unique()
+    country_matches = _best_matches([name for name in names
+                                     if name and name not in _COUNTRY_REPLACEMENTS and name not in _COUNTRY_SET],
+                                    _COUNTRY_NAMES, _COUNTRY_NAMES_PREP, score_cutoff)
     
     def match_country(name):
         if pd.isna(name):
@@ -209,25 +404,23 @@ def clean_country(raw_shark_attack_df, score_cutoff=80):
         if not name:
             return name
         
-        # Direct replacements for common cases
-        replacements = {
-            'USA': 'United States',
-            'AUSTRALIA': 'Australia',
-            'CEYLON (SRI LANKA)': 'Sri Lanka',
-            'SOUTH AFRICA': 'South Africa'
-        }
+        if name in _COUNTRY_REPLACEMENTS:
+            return _COUNTRY_REPLACEMENTS[name]
         
-        if name in replacements:
-            return replacements[name]
+        # Names that are already valid need no fuzzy matching
+        if name in _COUNTRY_SET:
+            return name
         
         # Use fuzzy matching for other cases
-        match = process.extractOne(name, country_names, score_cutoff=score_cutoff)
-        return match[0] if match else name
+        match = country_matches[name]
+        return match if match else name
     
-    shark_attack_df['Country'] = shark_attack_df['Country'].apply(match_country)
+    # Clean each distinct name once
+    cleaned_names = {name: match_country(name) for name in shark_attack_df['Country'].dropna().unique()}
+    shark_attack_df['Country'] = shark_attack_df['Country'].map(cleaned_names)
     return shark_attack_df
 
-def clean_activity(raw_shark_attack_df):
+def clean_activity(shark_attack_df):
     """
     Cleans the 'Activity' column of the shark attack DataFrame.
 
@@ -236,50 +429,36 @@ def clean_activity(raw_shark_attack_df):
     fuzzy matching to normalize the activity descriptions.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
 
     Returns:
-        pd.DataFrame: A new DataFrame with the 'Activity' column cleaned.
+        pd.DataFrame: The DataFrame with the 'Activity' column cleaned.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
-    
-    # Activity categories and keywords
-    activity_map = {
-        'Swimming': ['swimming', 'bathing', 'wading', 'floating'],
-        'Surfing': ['surfing', 'surf', 'bodyboarding', 'boogie boarding'],
-        'Diving': ['diving', 'snorkeling', 'free diving', 'scuba'],
-        'Fishing': ['fishing', 'spearfishing', 'angling'],
-        'Boating': ['boating', 'sailing', 'kayaking', 'canoeing'],
-        'Other': ['walking', 'standing', 'fell overboard', 'unknown']
-    }
-    
-    # Flatten all keywords for fuzzy matching
-    all_keywords = [keyword for keywords in activity_map.values() for keyword in keywords]
-    
-    def normalize_activity(activity):
-        if pd.isna(activity):
-            return 'Unknown'
-        activity = str(activity).lower().strip()
-        
-        # First try exact keyword matching
-        for category, keywords in activity_map.items():
+    
+    # Categorize each distinct activity once, missing activities get code -1
+    codes, activities = pd.factorize(shark_attack_df['Activity'].astype('string').str.lower().str.strip())
+    
+    def match_keywords(activity):
+        for category, keywords in _ACTIVITY_KEYWORDS.items():
             if any(keyword in activity for keyword in keywords):
                 return category
-        
-        # Try fuzzy matching for unmapped activities
-        match = process.extractOne(activity, all_keywords, score_cutoff=60)
-        if match:
-            matched_keyword = match[0]
-            for category, keywords in activity_map.items():
-                if matched_keyword in keywords:
-                    return category
-        
-        return 'Other'
+        return None
     
-    shark_attack_df['Activity'] = shark_attack_df['Activity'].apply(normalize_activity)
+    # First try exact keyword matching
+    categories = {activity: match_keywords(activity) for activity in activities}
+    
+    # Try fuzzy matching for the unmapped activities
+    unmapped = [activity for activity, category in categories.items() if category is None]
+    keyword_matches = _best_matches(unmapped, _ALL_ACTIVITY_KEYWORDS, _ALL_ACTIVITY_KEYWORDS_PREP, 60)
+    for activity, keyword in keyword_matches.items():
+        categories[activity] = _KEYWORD_CATEGORIES.get(keyword, 'Other')
+    
+    # Broadcast back to the rows, code -1 picks the appended fallback
+    labels = np.array([categories[activity] for activity in activities] + ['Unknown'], dtype=object)
+    shark_attack_df['Activity'] = labels[codes]
     return shark_attack_df
 
-def clean_species(raw_shark_attack_df, score_cutoff=70):
+def clean_species(shark_attack_df, score_cutoff=70):
     """
     Cleans the 'Species' column of the shark attack DataFrame.
 
@@ -288,26 +467,14 @@ def clean_species(raw_shark_attack_df, score_cutoff=70):
     to normalize the data.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
         score_cutoff (int): The minimum score for a fuzzy match to be considered valid.
 
     Returns:
-        pd.DataFrame: A new DataFrame with the 'Species' column cleaned.
+        pd.DataFrame: The DataFrame with the 'Species' column cleaned.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
-    
-    # Real shark species list
-    shark_species = [
-        'Great White Shark', 'Tiger Shark', 'Bull Shark', 'Blacktip Shark', 'Sandbar Shark',
-        'Nurse Shark', 'Lemon Shark', 'Hammerhead Shark', 'Mako Shark', 'Blue Shark',
-        'Sand Tiger Shark', 'Reef Shark', 'Wobbegong Shark', 'Thresher Shark', 'Dusky Shark',
-        'Spinner Shark', 'Silky Shark', 'Bronze Whaler Shark', 'Galapagos Shark', 'Grey Reef Shark',
-        'Blacktip Reef Shark', 'Whitetip Reef Shark', 'Caribbean Reef Shark', 'Silvertip Shark',
-        'Oceanic Whitetip Shark', 'Porbeagle Shark', 'Basking Shark', 'Whale Shark', 'Goblin Shark',
-        'Angel Shark', 'Leopard Shark', 'Dogfish Shark', 'Sevengill Shark', 'Sixgill Shark'
-    ]
-    
-    def normalize_species(species):
+    
+    def match_rules(species):
         if pd.isna(species):
             return 'Unknown'
         
@@ -315,9 +482,12 @@ def clean_species(raw_shark_attack_df, score_cutoff=70):
         if not species:
             return 'Unknown'
         
+        # Names that are already valid need no further checks
+        if species in _SHARK_SPECIES_SET:
+            return species
+        
         # Handle invalid/unconfirmed cases
-        invalid_terms = ['invalid', 'questionable', 'not confirmed', 'unconfirmed', 'not stated']
-        if any(term in species.lower() for term in invalid_terms):
+        if any(term in species.lower() for term in _INVALID_SPECIES_TERMS):
             return 'Unknown'
         
         # Handle size descriptions without species
@@ -325,71 +495,37 @@ def clean_species(raw_shark_attack_df, score_cutoff=70):
             if 'shark' not in species.lower():
                 return 'Unknown'
         
-        # Common name mappings
-        name_mappings = {
-            'white shark': 'Great White Shark',
-            'great white': 'Great White Shark',
-            'bull shark': 'Bull Shark',
-            'tiger shark': 'Tiger Shark',
-            'blacktip shark': 'Blacktip Shark',
-            'sand tiger': 'Sand Tiger Shark',
-            'wobbegong': 'Wobbegong Shark',
-            'hammerhead': 'Hammerhead Shark',
-            'mako': 'Mako Shark',
-            'blue shark': 'Blue Shark',
-            'nurse shark': 'Nurse Shark',
-            'lemon shark': 'Lemon Shark',
-            'spinner shark': 'Spinner Shark',
-            'dusky shark': 'Dusky Shark',
-            'silky shark': 'Silky Shark',
-            'bronze whaler': 'Bronze Whaler Shark',
-            'galapagos shark': 'Galapagos Shark',
-            'grey reef shark': 'Grey Reef Shark',
-            'blacktip reef shark': 'Blacktip Reef Shark',
-            'whitetip reef shark': 'Whitetip Reef Shark',
-            'caribbean reef shark': 'Caribbean Reef Shark',
-            'silvertip shark': 'Silvertip Shark',
-            'oceanic whitetip shark': 'Oceanic Whitetip Shark',
-            'porbeagle shark': 'Porbeagle Shark',
-            'basking shark': 'Basking Shark',
-            'whale shark': 'Whale Shark',
-            'goblin shark': 'Goblin Shark',
-            'angel shark': 'Angel Shark',
-            'leopard shark': 'Leopard Shark',
-            'dogfish shark': 'Dogfish Shark',
-            'sevengill shark': 'Sevengill Shark',
-            'sixgill shark': 'Sixgill Shark',
-            'reef shark': 'Reef Shark',
-            'sandbar shark': 'Sandbar Shark',
-            'thresher shark': 'Thresher Shark',
-            'reef': 'Reef Shark',
-            'sand tiger shark': 'Sand Tiger Shark',
-            'sand tiger': 'Sand Tiger Shark',
-            'unconfirmed': 'Unknown',
-            'Unconfirmed': 'Unknown',
-            'unknown': 'Unknown'
-        }
-        
         species_lower = species.lower()
-        for key, value in name_mappings.items():
+        for key, value in _SPECIES_NAME_MAP.items():
             if key in species_lower:
                 return value
         
-        # Fuzzy matching
-        match = process.extractOne(species, shark_species, score_cutoff=score_cutoff)
-        return match[0] if match else 'Unknown'
+        # Left for fuzzy matching
+        return None
     
     # Handle column name with trailing space
     species_col = 'Species ' if 'Species ' in shark_attack_df.columns else 'Species'
-    shark_attack_df['Species'] = shark_attack_df[species_col].apply(normalize_species)
+    
+    # Normalize each distinct species once
+    cleaned_species = {species: match_rules(species) for species in shark_attack_df[species_col].dropna().unique()}
+    
+    # Fuzzy match all distinct species not covered by the rules in a single batch
+    unmatched = {species: str(species).strip() for species, name in cleaned_species.items() if name is None}
+    species_matches = _best_matches(set(unmatched.values()), _SHARK_SPECIES, _SHARK_SPECIES_PREP, score_cutoff)
+    for species, stripped in unmatched.items():
+        cleaned_species[species] = species_matches[stripped] or 'Unknown'
+    
+    # A categorical column maps to a categorical when no two species merge, which has no 'Unknown' to fill in
+    species = shark_attack_df[species_col].map(cleaned_species).astype('string')
+    shark_attack_df['Species'] = species.fillna('Unknown')
     
     # Drop the original column if it had trailing space
     if species_col == 'Species ':
-        shark_attack_df = shark_attack_df.drop(columns=['Species '])
+        shark_attack_df.drop(columns=['Species '], inplace=True)
     
     return shark_attack_df
 
-def clean_injury(raw_shark_attack_df):
+def clean_injury(shark_attack_df):
     """
     Cleans the 'Injury' column of the shark attack DataFrame.
 
@@ -398,36 +534,26 @@ def clean_injury(raw_shark_attack_df):
     to normalize the injury descriptions.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
 
     Returns:
-        pd.DataFrame: A new DataFrame with a 'Body Part' column and the 'Injury' column removed.
+        pd.DataFrame: The DataFrame with a 'Body Part' column and the 'Injury' column removed.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
-
-    def categorize_body_part(injury):
-        injury = str(injury).lower()
-
-        if "leg" in injury or "thigh" in injury or "calf" in injury or "foot" in injury:
-            return "Leg / Foot"
-        elif "arm" in injury or "bicep" in injury or "wrist" in injury:
-            return "Arm"
-        elif "hand" in injury or "finger" in injury:
-            return "Hand / Fingers"
-        elif "shoulder" in injury:
-            return "Shoulder"
-        elif "abdomen" in injury or "stomach" in injury or "torso" in injury or "body" in injury:
-            return "Body / Abdomen"
-        elif "head" in injury or "face" in injury or "neck" in injury:
-            return "Head / Neck"
-        else:
-            return "Unspecified / Multiple"
-    
-    shark_attack_df['Body Part'] = shark_attack_df['Injury'].apply(categorize_body_part)
-    shark_attack_df = shark_attack_df.drop(columns=['Injury'], errors='ignore')
+    # Scan each distinct injury once, missing injuries get code -1
+    codes, injuries = pd.factorize(shark_attack_df['Injury'].astype('string'))
+    injuries = pd.Series(injuries, dtype='string')
+
+    # The first body part whose keywords appear in the injury wins
+    masks = [injuries.str.contains(pattern, na=False) for pattern in _BODY_PART_PATTERNS.values()]
+    body_parts = np.select(masks, list(_BODY_PART_PATTERNS), default='Unspecified / Multiple')
+
+    # Broadcast back to the rows, code -1 picks the appended fallback
+    body_parts = np.append(body_parts, 'Unspecified / Multiple')
+    shark_attack_df['Body Part'] = body_parts[codes]
+    shark_attack_df.drop(columns=['Injury'], errors='ignore', inplace=True)
     return shark_attack_df
 
-def clean_fatal(raw_shark_attack_df):
+def clean_fatal(shark_attack_df):
     """
     Cleans the 'Fatal Y/N' column of the shark attack DataFrame.
 
@@ -435,22 +561,14 @@ def clean_fatal(raw_shark_attack_df):
     yes/no representations to 'Yes' and 'No', and handling unknown values.
 
     Args:
-        raw_shark_attack_df (pd.DataFrame): The raw DataFrame containing shark attack data.
+        shark_attack_df (pd.DataFrame): The DataFrame containing shark attack data, modified in place.
 
     Returns:
-        pd.DataFrame: A new DataFrame with the 'Fatal Y/N' column cleaned.
+        pd.DataFrame: The DataFrame with the 'Fatal Y/N' column cleaned.
     """
-    shark_attack_df = raw_shark_attack_df.copy()
-    shark_attack_df['Fatal Y/N'] = shark_attack_df['Fatal Y/N'].fillna('')
-    shark_attack_df['Fatal Y/N'] = shark_attack_df['Fatal Y/N'].str.strip().str.upper()
-    shark_attack_df['Fatal Y/N'] = shark_attack_df['Fatal Y/N'].replace({
-        'Y': 'Yes',
-        'Y X 2': 'Yes',
-        'F': 'Yes',
-        'N': 'No',
-        'NQ': 'No'
-    })
-    shark_attack_df['Fatal Y/N'] = shark_attack_df['Fatal Y/N'].apply(lambda x: x if x in ['Yes', 'No'] else 'Unknown')
+    shark_attack_df['Fatal Y/N'] = _recode_categories(shark_attack_df['Fatal Y/N'].astype('string'),
+                                                      lambda fatal: _FATAL_MAPPING.get(fatal.strip().upper(), 'Unknown'),
+                                                      na_value='Unknown')
     return shark_attack_df
 
 def clean_data(raw_shark_attack_df):
@@ -466,15 +584,52 @@ def clean_data(raw_shark_attack_df):
     Returns:
         pd.DataFrame: A new, fully cleaned DataFrame.
     """
+    # Dropping the useless columns makes the only copy, every cleaner below modifies it in place
     shark_attack_df = drop_useless_columns(raw_shark_attack_df)
+    
+    # Store the text columns as Arrow-backed strings so the .str methods run as Arrow kernels
+    string_columns = shark_attack_df.columns.intersection(['Type', 'Sex', 'Country', 'State', 'Activity',
+                                                           'Species', 'Species ', 'Injury', 'Fatal Y/N'])
+    shark_attack_df[string_columns] = shark_attack_df[string_columns].astype('string[pyarrow]')
+    
+    # Encode the columns cleaned through a value mapping as categories, so the mapping only
+    # touches each distinct value instead of every row
+    mapped_columns = shark_attack_df.columns.intersection(['Type', 'Country'])
+    shark_attack_df[mapped_columns] = shark_attack_df[mapped_columns].astype('category')
+    
     shark_attack_df = clean_date(shark_attack_df)
     shark_attack_df = clean_sex(shark_attack_df)
     shark_attack_df = clean_age(shark_attack_df)
     shark_attack_df = clean_type(shark_attack_df)
-    shark_attack_df = clean_country(shark_attack_df, 60)
-    shark_attack_df = clean_state(shark_attack_df, 60)
-    shark_attack_df = clean_activity(shark_attack_df)
-    shark_attack_df = clean_species(shark_attack_df)
-    shark_attack_df = clean_injury(shark_attack_df)
+    
+    def clean_location(location_df):
+        location_df = clean_country(location_df, 60)
+        return clean_state(location_df, 60)
+    
+    # These cleaners read and write disjoint columns, so each runs on its own columns in a separate thread.
+    # Only their Arrow kernels and cdist calls release the GIL and overlap, the per-value Python rules
+    # (activity regex loop, species match_rules) still take turns. Each cdist already uses every core
+    # on its own, so the threads mainly let one cleaner's Python work run while another waits on a kernel
+    species_col = 'Species ' if 'Species ' in shark_attack_df.columns else 'Species'
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        location = executor.submit(clean_location, shark_attack_df[['Country', 'State']])
+        activity = executor.submit(clean_activity, shark_attack_df[['Activity']])
+        species = executor.submit(clean_species, shark_attack_df[[species_col]])
+        body_part = executor.submit(clean_injury, shark_attack_df[['Injury']])
+    
+    shark_attack_df[['Country', 'State']] = location.result()
+    shark_attack_df['Activity'] = activity.result()['Activity']
+    shark_attack_df['Species'] = species.result()['Species']
+    if species_col == 'Species ':
+        shark_attack_df.drop(columns=['Species '], inplace=True)
+    shark_attack_df['Body Part'] = body_part.result()['Body Part']
+    shark_attack_df.drop(columns=['Injury'], inplace=True)
+    
     shark_attack_df = clean_fatal(shark_attack_df)
+    
+    # The cleaned text columns only hold a handful of distinct values, store them as categories
+    for column in ['Country', 'State', 'Activity', 'Species', 'Body Part', 'Type', 'Sex', 'Fatal Y/N']:
+        shark_attack_df[column] = shark_attack_df[column].astype('category')
+    shark_attack_df['Month'] = shark_attack_df['Month'].astype(
+        pd.CategoricalDtype(list(_MONTH_NAMES.values()), ordered=True))
     return shark_attack_df
\ No newline at end of file
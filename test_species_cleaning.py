@@ -19,4 +19,8 @@ shark_attack_df = cl.clean_species(shark_attack_df)
 # Show results
 print("Species cleaning results:")
 print(shark_attack_df['Species'].value_counts().head(20))
-print(f"\nUnique species count: {shark_attack_df['Species'].nunique()}")
\ No newline at end of file
+print(f"\nUnique species count: {shark_attack_df['Species'].nunique()}")
+
+# A single row with a missing species still cleans, its species becomes 'Unknown'
+single_row_df = cl.clean_data(df.iloc[97:98])
+print(f"\nSingle row species: {single_row_df['Species'].tolist()}")